@@ -14,6 +14,56 @@ ChartJS.register(
   Legend
 );
 
+// Chart styling is static, so it is defined once instead of on every render
+const CHART_OPTIONS = {
+  responsive: true,
+  plugins: {
+    legend: {
+      position: 'top',
+      labels: { color: 'white' },
+    },
+    title: {
+      display: true,
+      text: 'Frequency of Ad Topics',
+      color: 'white',
+    },
+    tooltip: {
+      callbacks: {
+        label: function(context) {
+          let label = context.dataset.label || '';
+          if (label) {
+            label += ': ';
+          }
+          if (context.parsed.y !== null) {
+            label += context.parsed.y;
+          }
+          return label;
+        }
+      }
+    }
+  },
+  scales: {
+    x: {
+      ticks: { color: 'white' },
+      grid: { color: 'rgba(255, 255, 255, 0.1)' }
+    },
+    y: {
+      ticks: { color: 'white' },
+      grid: { color: 'rgba(255, 255, 255, 0.1)' }
+    },
+  },
+};
+
+const AD_PREFERENCES_FILE = 'data/ads_information/ad_preferences.json';
+
+const SIZE_UNITS = ['B', 'KB', 'MB'];
+
+const formatSize = (bytes) => {
+  if (bytes === 0) return '0 B';
+  const k = 1024;
+  const i = Math.floor(Math.log(bytes) / Math.log(k));
+  return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + SIZE_UNITS[i];
+};
 
 const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
   const [isAnalyzing, setIsAnalyzing] = useState(true); // Start as analyzing
@@ -78,52 +128,54 @@ const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
     const url = URL.createObjectURL(blob);
     const a = document.createElement('a');
     a.href = url;
-    a.download = `psychological_profile_${new Date().toISOString().split('T')[0]}.md`;
+    a.download = `psychological_profile_${new Date().toISOString().slice(0, 10)}.md`;
     document.body.appendChild(a);
     a.click();
     document.body.removeChild(a);
     URL.revokeObjectURL(url);
   };
-  const adPreferencesData = extractedData['data/ads_information/ad_preferences.json'];
-  const advertisersInteractedData = extractedData['data/ads_information/advertisers_who_interacted_with_you.json'];
-  const adInterestsData = extractedData['data/ads_information/ad_interests.json'];
-  let parsedAdPreferences = null;
-  if (adPreferencesData) {
-    try {
-      parsedAdPreferences = JSON.parse(adPreferencesData);
-    } catch (error) {
-      console.error('Error parsing ad_preferences.json:', error);
-    }
-  }
+  // Byte size of every extracted file, measured once per dataset (each Blob copies the whole content)
+  const fileList = useMemo(() => (
+    Object.keys(extractedData).map(filename => ({
+      filename,
+      size: new Blob([extractedData[filename]]).size
+    }))
+  ), [extractedData]);
 
-  // This preserves the structure for future use if needed
-  if (advertisersInteractedData) {
-    try {
-      JSON.parse(advertisersInteractedData); // Parse to validate but don't store
-    } catch (error) {
-      console.error('Error parsing advertisers_you_interacted_with.json:', error);
-    }
-  }
+  // Summary panel shows the first 20 lines of the profile; split once per result, not per render
+  const summaryMarkdown = useMemo(() => {
+    if (!analysisResult) return '';
+    return analysisResult.split('\n').slice(0, 20).join('\n') + '\n\n*View complete analysis in the right panel*';
+  }, [analysisResult]);
 
-  // Similarly for ad interests
-  if (adInterestsData) {
+  // Only ad_preferences.json is rendered on this page, so it is the only file parsed here.
+  // Parse it once per dataset instead of on every render (analysis state changes re-render often)
+  const parsedAdPreferences = useMemo(() => {
+    const adPreferencesData = extractedData[AD_PREFERENCES_FILE];
+    if (!adPreferencesData) return null;
     try {
-      JSON.parse(adInterestsData); // Parse to validate but don't store
+      return JSON.parse(adPreferencesData);
     } catch (error) {
-      console.error('Error parsing ad_interests.json:', error);
+      console.error('Error parsing ad_preferences.json:', error);
+      return null;
     }
-  }
+  }, [extractedData]);
 
-  // Statistics are calculated but used in the UI via direct references to the parsed data
+  // Resolve the topics list once; everything below reads this instead of re-walking the parsed file
+  const adTopics = useMemo(() => parsedAdPreferences?.preferences_v2_ad_topics || [], [parsedAdPreferences]);
+  const hasAdTopics = adTopics.length > 0;
 
-  const adTopicsData = parsedAdPreferences?.preferences_v2_ad_topics || [];
-  const topicNames = adTopicsData.map(topic => topic.name);
-  const topicCounts = topicNames.reduce((acc, topic) => {
-    acc[topic] = (acc[topic] || 0) + 1;
-    return acc;
-  }, {});
+  // Count topic occurrences in one pass, once per parsed file
+  const topicCounts = useMemo(() => {
+    const counts = {};
+    for (const topic of adTopics) {
+      counts[topic.name] = (counts[topic.name] || 0) + 1;
+    }
+    return counts;
+  }, [adTopics]);
 
-  const adTopicsChartData = {
+  // Keep the same chart data object across renders so the chart is not rebuilt on unrelated state changes
+  const adTopicsChartData = useMemo(() => ({
     labels: Object.keys(topicCounts),
     datasets: [
       {
@@ -134,46 +186,8 @@ const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
         borderWidth: 1,
       },
     ],
-  };
+  }), [topicCounts]);
 
-  const chartOptions = {
-    responsive: true,
-    plugins: {
-      legend: {
-        position: 'top',
-        labels: { color: 'white' },
-      },
-      title: {
-        display: true,
-        text: 'Frequency of Ad Topics',
-        color: 'white',
-      },
-      tooltip: {
-        callbacks: {
-          label: function(context) {
-            let label = context.dataset.label || '';
-            if (label) {
-              label += ': ';
-            }
-            if (context.parsed.y !== null) {
-              label += context.parsed.y;
-            }
-            return label;
-          }
-        }
-      }
-    },
-    scales: {
-      x: {
-        ticks: { color: 'white' },
-        grid: { color: 'rgba(255, 255, 255, 0.1)' }
-      },
-      y: {
-        ticks: { color: 'white' },
-        grid: { color: 'rgba(255, 255, 255, 0.1)' }
-      },
-    },
-  };
   return (
     <div className="min-h-screen flex items-center justify-center p-4">
       <div className="max-w-2xl w-full text-center">
@@ -184,11 +198,11 @@ const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
 
 
 
-        {parsedAdPreferences?.preferences_v2_ad_topics?.length > 0 && (
+        {hasAdTopics && (
           <div className="glass rounded-xl p-6 mb-6 text-left">
             <h3 className="text-white font-semibold mb-4">🎯 Your Ad Topics</h3>
             <div className="space-y-2 text-white/80 text-sm">
-              {parsedAdPreferences.preferences_v2_ad_topics.map((topic, index) => (
+              {adTopics.map((topic, index) => (
                 <div key={index} className="flex justify-between items-center">
                   <span>{topic.name}</span>
                 </div>
@@ -196,11 +210,11 @@ const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
             </div>
           </div>
         )}
-        {parsedAdPreferences?.preferences_v2_ad_topics?.length > 0 && (
+        {hasAdTopics && (
           <div className="glass rounded-xl p-6 mb-6 text-left">
             <h3 className="text-white font-semibold mb-4">📊 Ad Topics Distribution</h3>
             <div className="space-y-2 text-white/80 text-sm">
-              <Bar data={adTopicsChartData} options={chartOptions} />
+              <Bar data={adTopicsChartData} options={CHART_OPTIONS} />
             </div>
           </div>
         )}
@@ -209,27 +223,15 @@ const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
         <div className="glass rounded-xl p-6 mb-6">
           <h3 className="text-white font-semibold mb-4">📁 Extracted JSON Files</h3>
           <p className="text-white/70 text-sm mb-4">
-            {Object.keys(extractedData).length} JSON files ready for analysis:
+            {fileList.length} JSON files ready for analysis:
           </p>
           <div className="max-h-40 overflow-y-auto space-y-1">
-            {Object.keys(extractedData).map((filename, index) => {
-              const content = extractedData[filename];
-              const size = new Blob([content]).size;
-              const formatSize = (bytes) => {
-                if (bytes === 0) return '0 B';
-                const k = 1024;
-                const sizes = ['B', 'KB', 'MB'];
-                const i = Math.floor(Math.log(bytes) / Math.log(k));
-                return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
-              };
-              
-              return (
-                <div key={index} className="flex justify-between items-center bg-white/5 p-2 rounded text-sm">
-                  <span className="text-white/90 truncate flex-1">{filename}</span>
-                  <span className="text-white/60 text-xs ml-2">{formatSize(size)}</span>
-                </div>
-              );
-            })}
+            {fileList.map(({ filename, size }, index) => (
+              <div key={index} className="flex justify-between items-center bg-white/5 p-2 rounded text-sm">
+                <span className="text-white/90 truncate flex-1">{filename}</span>
+                <span className="text-white/60 text-xs ml-2">{formatSize(size)}</span>
+              </div>
+            ))}
           </div>
         </div>
 
@@ -307,7 +309,7 @@ const AnalysisPage = ({ extractedData, onStartOver, onAIAnalysis }) => {
                     </h3>
                     <div className="flex-1 overflow-y-auto custom-scrollbar pr-2">
                       <MarkdownPreview
-                        source={analysisResult.split('\n').slice(0, 20).join('\n') + '\n\n*View complete analysis in the right panel*'}
+                        source={summaryMarkdown}
                         style={{ 
                           backgroundColor: 'transparent', 
                           color: '#f1f5f9',
@@ -100,43 +100,53 @@ const LandingPage = ({ onFilesUploaded, onTestClick }) => {
         let htmlFileCount = 0;
         let totalFileCount = 0;
         
-        // First pass: count file types
-        for (const entry of entries) {
-          if (!entry.directory) {
-            totalFileCount++;
-            if (entry.filename.toLowerCase().endsWith('.json')) {
-              jsonFileCount++;
-            } else if (entry.filename.toLowerCase().endsWith('.html')) {
-              htmlFileCount++;
-            }
+        // Single pass: count file types and extract files (both JSON and HTML)
+        // Entries are extracted concurrently so zip.js can spread the work over its worker pool
+        const extractions = entries.map(async (entry) => {
+          if (entry.directory) {
+            return null;
           }
-        }
+          
+          totalFileCount++;
+          const filename = entry.filename.toLowerCase();
+          const isJsonFile = filename.endsWith('.json');
+          const isHtmlFile = !isJsonFile && filename.endsWith('.html');
+          
+          if (isJsonFile) {
+            jsonFileCount++;
+          } else if (isHtmlFile) {
+            htmlFileCount++;
+          } else {
+            return null;
+          }
+          
+          const fileType = isJsonFile ? 'JSON' : 'HTML';
+          console.log(`✅ Processing ${fileType} file: ${entry.filename}`);
+          try {
+            const writer = new TextWriter();
+            const content = await entry.getData(writer);
+            console.log(`📄 Successfully extracted: ${entry.filename} (${content.length} characters)`);
+            return [entry.filename, content];
+          } catch (entryError) {
+            console.error(`❌ Failed to extract ${entry.filename}:`, entryError);
+            return null;
+          }
+        });
         
+        // Counting happens before the first await in each callback, so the totals are already complete here
         console.log(`📊 File type summary:`);
         console.log(`   📄 Total files: ${totalFileCount}`);
         console.log(`   🔧 JSON files: ${jsonFileCount}`);
         console.log(`   🌐 HTML files: ${htmlFileCount}`);
         console.log(`   📁 Other files: ${totalFileCount - jsonFileCount - htmlFileCount}`);
         
-        // Second pass: process files (both JSON and HTML)
+        // Store results in ZIP order
         let processedFileCount = 0;
-        for (const entry of entries) {
-          const filename = entry.filename.toLowerCase();
-          const isJsonFile = filename.endsWith('.json');
-          const isHtmlFile = filename.endsWith('.html');
-          
-          if (!entry.directory && (isJsonFile || isHtmlFile)) {
-            const fileType = isJsonFile ? 'JSON' : 'HTML';
-            console.log(`✅ Processing ${fileType} file: ${entry.filename}`);
-            try {
-              const writer = new TextWriter();
-              const content = await entry.getData(writer);
-              allFilesExtractedData[entry.filename] = content;
-              processedFileCount++;
-              console.log(`📄 Successfully extracted: ${entry.filename} (${content.length} characters)`);
-            } catch (entryError) {
-              console.error(`❌ Failed to extract ${entry.filename}:`, entryError);
-            }
+        for (const extracted of await Promise.all(extractions)) {
+          if (extracted) {
+            const [entryFilename, content] = extracted;
+            allFilesExtractedData[entryFilename] = content;
+            processedFileCount++;
           }
         }
         
@@ -150,13 +160,18 @@ const LandingPage = ({ onFilesUploaded, onTestClick }) => {
       console.log('📋 Extracted file names:', Object.keys(allFilesExtractedData));
       
       // Count file types in extracted data
-      const extractedFiles = Object.keys(allFilesExtractedData);
-      const extractedJson = extractedFiles.filter(f => f.toLowerCase().endsWith('.json')).length;
-      const extractedHtml = extractedFiles.filter(f => f.toLowerCase().endsWith('.html')).length;
+      let extractedJson = 0;
+      let extractedHtml = 0;
+      for (const extractedFile of Object.keys(allFilesExtractedData)) {
+        const filename = extractedFile.toLowerCase();
+        if (filename.endsWith('.json')) {
+          extractedJson++;
+        } else if (filename.endsWith('.html')) {
+          extractedHtml++;
+        }
+      }
       console.log(`📊 Extracted breakdown: ${extractedJson} JSON files, ${extractedHtml} HTML files`);
       
-      console.log('💾 All extracted data:', allFilesExtractedData);
-      
       onFilesUploaded(allFilesExtractedData); // Pass extracted data to App.js
     } catch (error) {
       console.error('❌ Error during ZIP extraction:', error);
@@ -3,15 +3,29 @@ import { ArrowLeft, Brain, Clock, AlertCircle, Download, CheckCircle } from 'luc
 import ProfileAnalyzer from '../utils/profileAnalyzer';
 import { selectDataForPrompt } from '../utils/promptDataSelector';
 
+// HTML tag and style for each markdown header level
+const HEADER_STYLES = {
+  '#': ['h1', 'font-size: 1.5em; font-weight: 800; margin: 2em 0 1em 0; color: #111827;'],
+  '##': ['h2', 'font-size: 1.25em; font-weight: 700; margin: 2em 0 1em 0; color: #1f2937;'],
+  '###': ['h3', 'font-size: 1.1em; font-weight: 600; margin: 1.5em 0 0.5em 0; color: #374151;']
+};
+
+// HTML replacement for paragraph breaks and single line breaks
+const LINE_BREAKS = {
+  '\n\n': '<div style="margin: 1em 0;"></div>',
+  '\n': '<br>'
+};
+
 // Function to format analysis text from markdown-like format to HTML
 const formatAnalysisText = (text) => {
   if (!text) return '';
   
   return text
-    // Convert markdown headers to HTML
-    .replace(/^### (.*$)/gim, '<h3 style="font-size: 1.1em; font-weight: 600; margin: 1.5em 0 0.5em 0; color: #374151;">$1</h3>')
-    .replace(/^## (.*$)/gim, '<h2 style="font-size: 1.25em; font-weight: 700; margin: 2em 0 1em 0; color: #1f2937;">$1</h2>')
-    .replace(/^# (.*$)/gim, '<h1 style="font-size: 1.5em; font-weight: 800; margin: 2em 0 1em 0; color: #111827;">$1</h1>')
+    // Convert markdown headers to HTML (all levels in one pass)
+    .replace(/^(#{1,3}) (.*$)/gim, (match, hashes, title) => {
+      const [tag, style] = HEADER_STYLES[hashes];
+      return `<${tag} style="${style}">${title}</${tag}>`;
+    })
     
     // Convert bold text
     .replace(/\*\*(.*?)\*\*/g, '<strong style="font-weight: 600; color: #1f2937;">$1</strong>')
@@ -22,9 +36,8 @@ const formatAnalysisText = (text) => {
     // Convert numbered lists
     .replace(/^\d+\. (.*$)/gim, '<div style="margin: 0.5em 0; padding-left: 1em;">$1</div>')
     
-    // Convert line breaks to proper spacing
-    .replace(/\n\n/g, '<div style="margin: 1em 0;"></div>')
-    .replace(/\n/g, '<br>')
+    // Convert line breaks to proper spacing (paragraph breaks and single breaks in one pass)
+    .replace(/\n\n|\n/g, (lineBreak) => LINE_BREAKS[lineBreak])
     
     // Convert sections with === or --- separators
     .replace(/^={3,}$/gim, '<hr style="margin: 2em 0; border: none; border-top: 2px solid #e5e7eb;">')
@@ -70,29 +83,42 @@ const ProfileAnalysisPage = ({ jsonData, prompts, onBack, onStartOver }) => {
         // Select data based on prompt configuration
         const selectionResult = await selectDataForPrompt(prompt.name, jsonData);
         const selectedData = selectionResult.selectedData || selectionResult;
-        console.log(`📊 Selected ${Object.keys(selectedData).length} files for prompt: ${prompt.name}`);
-        
-        // Load the prompt from Langfuse
-        await analyzer.loadPrompt(prompt.name);
-        
-        // Run analysis
-        const result = await analyzer.analyzeProfile(selectedData);
+        const dataCount = Object.keys(selectedData).length;
+        console.log(`📊 Selected ${dataCount} files for prompt: ${prompt.name}`);
         
-        if (result.success) {
+        // Nothing to analyze for this prompt: skip loading the prompt and calling the model
+        if (dataCount === 0) {
+          console.warn(`⚠️ No data selected for prompt: ${prompt.name}, skipping`);
           results.push({
             promptName: prompt.name,
-            profile: result.profile,
-            stats: result.stats,
-            dataCount: Object.keys(selectedData).length
+            error: "No exported files matched this prompt's data configuration",
+            dataCount
           });
-          console.log(`✅ Completed prompt: ${prompt.name}`);
         } else {
-          console.error(`❌ Failed prompt: ${prompt.name}`, result.error);
-          results.push({
-            promptName: prompt.name,
-            error: result.error,
-            dataCount: Object.keys(selectedData).length
-          });
+          // Load the prompt from Langfuse
+          await analyzer.loadPrompt(prompt.name);
+          
+          // Run analysis
+          const result = await analyzer.analyzeProfile(selectedData);
+          
+          if (result.success) {
+            results.push({
+              promptName: prompt.name,
+              profile: result.profile,
+              // Convert to HTML once here instead of on every re-render of the results list
+              profileHtml: formatAnalysisText(result.profile),
+              stats: result.stats,
+              dataCount
+            });
+            console.log(`✅ Completed prompt: ${prompt.name}`);
+          } else {
+            console.error(`❌ Failed prompt: ${prompt.name}`, result.error);
+            results.push({
+              promptName: prompt.name,
+              error: result.error,
+              dataCount
+            });
+          }
         }
         
         setCompletedPrompts(i + 1);
@@ -130,7 +156,7 @@ const ProfileAnalysisPage = ({ jsonData, prompts, onBack, onStartOver }) => {
     const url = URL.createObjectURL(blob);
     const a = document.createElement('a');
     a.href = url;
-    a.download = `facebook_analysis_${new Date().toISOString().split('T')[0]}.md`;
+    a.download = `facebook_analysis_${new Date().toISOString().slice(0, 10)}.md`;
     document.body.appendChild(a);
     a.click();
     document.body.removeChild(a);
@@ -270,14 +296,7 @@ const ProfileAnalysisPage = ({ jsonData, prompts, onBack, onStartOver }) => {
                         <h3 className="text-lg font-semibold text-gray-900">{result.promptName} Analysis</h3>
                         <span className="text-sm text-gray-500">{result.dataCount} files processed</span>
                       </div>
-                      <div className="prose prose-gray max-w-none">
-                        <div 
-                          className="formatted-analysis text-sm text-gray-700 leading-relaxed"
-                          dangerouslySetInnerHTML={{
-                            __html: formatAnalysisText(result.profile)
-                          }}
-                        />
-                      </div>
+                      <p className="text-sm text-red-600">{result.error}</p>
                     </div>
                   </div>
                 ) : (
@@ -294,7 +313,7 @@ const ProfileAnalysisPage = ({ jsonData, prompts, onBack, onStartOver }) => {
                           fontFamily: 'system-ui, -apple-system, sans-serif'
                         }}
                         dangerouslySetInnerHTML={{
-                          __html: formatAnalysisText(result.profile)
+                          __html: result.profileHtml
                         }}
                       />
                     </div>
@@ -82,32 +82,36 @@ class LangfuseManager {
       console.log('Raw prompts REST API response:', promptsList);
 
       if (promptsList && promptsList.data && Array.isArray(promptsList.data)) {
-        // Process each prompt metadata
-        for (const promptMeta of promptsList.data) {
+        // Get the full prompt data for all prompts concurrently using the prompt.get method
+        const fullPrompts = await Promise.all(promptsList.data.map(async (promptMeta) => {
           try {
             console.log(`🔍 Loading full prompt data for: ${promptMeta.name}`);
-            
-            // Get the full prompt data using the prompt.get method
-            const fullPrompt = await this.client.prompt.get(promptMeta.name);
-            
-            if (fullPrompt) {
-              this.prompts.set(fullPrompt.name, {
-                id: fullPrompt.id || promptMeta.id,
-                name: fullPrompt.name || promptMeta.name,
-                version: fullPrompt.version || promptMeta.version,
-                prompt: fullPrompt.prompt,
-                config: fullPrompt.config || {},
-                labels: fullPrompt.labels || promptMeta.labels || [],
-                tags: fullPrompt.tags || promptMeta.tags || [],
-                createdAt: fullPrompt.createdAt || promptMeta.createdAt,
-                updatedAt: fullPrompt.updatedAt || promptMeta.updatedAt
-              });
-              console.log(`✅ Loaded prompt: ${fullPrompt.name} (v${fullPrompt.version})`);
-            }
+            return await this.client.prompt.get(promptMeta.name);
           } catch (promptError) {
             console.warn(`⚠️ Failed to load full data for prompt "${promptMeta.name}":`, promptError);
+            return null;
           }
-        }
+        }));
+
+        // Process each prompt metadata (in list order)
+        promptsList.data.forEach((promptMeta, i) => {
+          const fullPrompt = fullPrompts[i];
+
+          if (fullPrompt) {
+            this.prompts.set(fullPrompt.name, {
+              id: fullPrompt.id || promptMeta.id,
+              name: fullPrompt.name || promptMeta.name,
+              version: fullPrompt.version || promptMeta.version,
+              prompt: fullPrompt.prompt,
+              config: fullPrompt.config || {},
+              labels: fullPrompt.labels || promptMeta.labels || [],
+              tags: fullPrompt.tags || promptMeta.tags || [],
+              createdAt: fullPrompt.createdAt || promptMeta.createdAt,
+              updatedAt: fullPrompt.updatedAt || promptMeta.updatedAt
+            });
+            console.log(`✅ Loaded prompt: ${fullPrompt.name} (v${fullPrompt.version})`);
+          }
+        });
       } else {
         console.warn('⚠️ No prompts found or unexpected API response format');
       }
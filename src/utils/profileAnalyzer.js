@@ -69,8 +69,9 @@ class ProfileAnalyzer {
     let totalFiles = 0;
     let totalChars = 0;
     let chunks = [];
-    let currentChunk = "";
-    let filesInCurrentChunk = 0;
+    // Current chunk is collected as a list of file entries and joined once when it is full
+    let currentChunkParts = [];
+    let currentChunkLength = 0;
 
     console.log("Processing files (JSON and HTML)...");
 
@@ -82,13 +83,19 @@ class ProfileAnalyzer {
     for (const [filename, content] of sortedEntries) {
       try {
         let formattedContent;
+        const lowerFilename = filename.toLowerCase();
         
         // Check if it's JSON or HTML based on filename
-        if (filename.toLowerCase().endsWith('.json')) {
+        if (lowerFilename.endsWith('.json')) {
+          // Empty files cannot be parsed; skip them instead of going through the exception path
+          if (content === '') {
+            console.log(`Skipping empty file ${filename}`);
+            continue;
+          }
           // Parse JSON content if it's a string
           const jsonData = typeof content === 'string' ? JSON.parse(content) : content;
           formattedContent = JSON.stringify(jsonData, null, 2);
-        } else if (filename.toLowerCase().endsWith('.html')) {
+        } else if (lowerFilename.endsWith('.html')) {
           // For HTML files, use content directly but truncate if too long
           formattedContent = typeof content === 'string' ? content : String(content);
           // Truncate very long HTML files to prevent token overflow
@@ -103,16 +110,16 @@ class ProfileAnalyzer {
         const fileEntry = `\n\n### FILE: ${filename}\n\n${formattedContent}`;
         
         // Check if adding this file would exceed chunk size
-        if ((currentChunk.length + fileEntry.length > this.MAX_CHUNK_SIZE) || 
-            (filesInCurrentChunk >= this.MAX_FILES_PER_CHUNK && currentChunk.length > 0)) {
+        if ((currentChunkLength + fileEntry.length > this.MAX_CHUNK_SIZE) || 
+            (currentChunkParts.length >= this.MAX_FILES_PER_CHUNK && currentChunkLength > 0)) {
           // Save current chunk and start a new one
-          chunks.push(currentChunk);
-          currentChunk = fileEntry;
-          filesInCurrentChunk = 1;
+          chunks.push(currentChunkParts.join(''));
+          currentChunkParts = [fileEntry];
+          currentChunkLength = fileEntry.length;
         } else {
           // Add to current chunk
-          currentChunk += fileEntry;
-          filesInCurrentChunk++;
+          currentChunkParts.push(fileEntry);
+          currentChunkLength += fileEntry.length;
         }
         
         totalChars += fileEntry.length;
@@ -127,8 +134,8 @@ class ProfileAnalyzer {
     }
 
     // Add the last chunk if it's not empty
-    if (currentChunk.length > 0) {
-      chunks.push(currentChunk);
+    if (currentChunkLength > 0) {
+      chunks.push(currentChunkParts.join(''));
     }
 
     console.log(`Processed ${totalFiles} files (JSON/HTML) into ${chunks.length} chunks`);
@@ -2,10 +2,25 @@
  * Utility for selecting data points based on prompt configuration
  */
 
+// Cached prompt configuration request (shared by all callers)
+let promptConfigPromise = null;
+
 /**
  * Load prompt configuration from prompt_config.json
+ * The config is static, so it is fetched once and reused; failed loads are retried on the next call.
  */
 async function loadPromptConfig() {
+  if (!promptConfigPromise) {
+    promptConfigPromise = fetchPromptConfig();
+  }
+  const config = await promptConfigPromise;
+  if (!config) {
+    promptConfigPromise = null;
+  }
+  return config;
+}
+
+async function fetchPromptConfig() {
   try {
     const response = await fetch('/prompt_config.json');
     if (!response.ok) {
@@ -27,22 +42,57 @@ function normalizePath(path) {
 }
 
 /**
- * Check if a file path matches a pattern (exact file or folder)
+ * Build lookup tables for the configured patterns
+ * File patterns (*.json) are keyed by the path suffix they match (plus their .html twin),
+ * folder patterns by the folder path they match.
  */
-function matchesPattern(filePath, pattern) {
-  const normalizedFile = normalizePath(filePath);
-  const normalizedPattern = normalizePath(pattern);
-  
-  // If pattern ends with .json, look for both .json and .html versions
-  if (normalizedPattern.endsWith('.json')) {
-    const basePattern = normalizedPattern.replace('.json', '');
-    const jsonMatch = normalizedFile === normalizedPattern || normalizedFile.endsWith('/' + normalizedPattern);
-    const htmlMatch = normalizedFile === basePattern + '.html' || normalizedFile.endsWith('/' + basePattern + '.html');
-    return jsonMatch || htmlMatch;
+function buildPatternIndex(patterns) {
+  const fileIndex = new Map();
+  const folderIndex = new Map();
+  const add = (index, key, patternIndex) => {
+    if (!index.has(key)) {
+      index.set(key, []);
+    }
+    index.get(key).push(patternIndex);
+  };
+
+  patterns.forEach((pattern, i) => {
+    const normalizedPattern = normalizePath(pattern);
+    if (normalizedPattern.endsWith('.json')) {
+      // Look for both .json and .html versions
+      add(fileIndex, normalizedPattern, i);
+      add(fileIndex, normalizedPattern.replace('.json', '') + '.html', i);
+    } else {
+      add(folderIndex, normalizedPattern, i);
+    }
+  });
+
+  return { fileIndex, folderIndex };
+}
+
+/**
+ * Find the indices of all patterns matching a normalized file path
+ * Instead of testing every pattern, look up every path suffix that starts after a '/'
+ * (file patterns) and every folder path between two '/' (folder patterns).
+ */
+function findMatchingPatterns(normalizedFile, { fileIndex, folderIndex }) {
+  const matches = new Set();
+  const addAll = (patternIndices) => patternIndices?.forEach(i => matches.add(i));
+
+  const slashes = [-1];
+  for (let i = normalizedFile.indexOf('/'); i !== -1; i = normalizedFile.indexOf('/', i + 1)) {
+    slashes.push(i);
   }
-  
-  // Otherwise, it's a folder pattern - check if file is inside this folder
-  return normalizedFile.startsWith(normalizedPattern + '/') || normalizedFile.includes('/' + normalizedPattern + '/');
+
+  for (let a = 0; a < slashes.length; a++) {
+    const start = slashes[a] + 1;
+    addAll(fileIndex.get(normalizedFile.slice(start)));
+    for (let b = a + 1; b < slashes.length; b++) {
+      addAll(folderIndex.get(normalizedFile.slice(start, slashes[b])));
+    }
+  }
+
+  return matches;
 }
 
 /**
@@ -85,19 +135,30 @@ export async function selectDataForPrompt(promptName, extractedData) {
   // Select files based on the configuration
   const selectedData = {};
   const usedFiles = [];
+  const usedFileSet = new Set();
   const availableFiles = Object.keys(extractedData);
+  const patterns = promptSettings.data;
+  const patternIndex = buildPatternIndex(patterns);
+  
+  // Match every file against all patterns in a single pass, keeping file order per pattern
+  const matchesByPattern = patterns.map(() => []);
+  for (const filePath of availableFiles) {
+    for (const i of findMatchingPatterns(normalizePath(filePath), patternIndex)) {
+      matchesByPattern[i].push(filePath);
+    }
+  }
   
   // Process each pattern in the prompt configuration
-  for (const pattern of promptSettings.data) {
+  patterns.forEach((pattern, i) => {
     console.log(`🔍 Processing pattern: "${pattern}"`);
     
-    // Find all files that match this pattern
-    const matchingFiles = availableFiles.filter(filePath => matchesPattern(filePath, pattern));
+    const matchingFiles = matchesByPattern[i];
     
     if (matchingFiles.length > 0) {
       console.log(`  ✅ Found ${matchingFiles.length} files matching pattern "${pattern}"`);
       matchingFiles.forEach(file => {
-        if (!selectedData[file]) { // Avoid duplicates
+        if (!usedFileSet.has(file)) { // Avoid duplicates
+          usedFileSet.add(file);
           selectedData[file] = extractedData[file];
           usedFiles.push(file);
         }
@@ -105,7 +166,7 @@ export async function selectDataForPrompt(promptName, extractedData) {
     } else {
       console.log(`  ⚠️ No files found matching pattern "${pattern}"`);
     }
-  }
+  });
   
   console.log(`📊 Selected ${usedFiles.length} files out of ${availableFiles.length} total files`);
   console.log('📋 Used files:', usedFiles);